@@ -5,6 +5,7 @@ This module has to use numerous internal Pydantic APIs and is therefore brittle
 
 from __future__ import annotations as _annotations
 
+from functools import cache
 from inspect import Parameter, signature
 from typing import TYPE_CHECKING, Any, Callable, TypedDict, cast, get_origin
 
@@ -38,6 +39,7 @@ class FunctionSchema(TypedDict):
     var_positional_field: str | None
 
 
+@cache
 def function_schema(  # noqa: C901
     function: Callable[..., Any],
     takes_ctx: bool,
@@ -46,6 +48,12 @@ def function_schema(  # noqa: C901
 ) -> FunctionSchema:
     """Build a Pydantic validator and JSON schema from a tool function.
 
+    Building the schema validator is expensive, so results are memoized — registering the same function
+    (with the same options) on multiple agents only builds its schema once. The cache is unbounded and
+    holds a strong reference to every function passed in, pinning it and its compiled validator for the
+    life of the process; that's fine for module-level tools, but worth knowing if you create agents from
+    freshly-defined closures per request.
+
     Args:
         function: The function to build a validator and JSON schema for.
         takes_ctx: Whether the function takes a `RunContext` first argument.
@@ -2,6 +2,7 @@ from __future__ import annotations as _annotations
 
 import dataclasses
 import inspect
+import os
 from collections.abc import Awaitable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable, Generic, Literal, Union, cast
@@ -14,8 +15,19 @@ from . import _pydantic, _utils, messages as _messages, models
 from .exceptions import ModelRetry, UnexpectedModelBehavior
 
 if TYPE_CHECKING:
+    import orjson
+
     from .result import Usage
 
+    _orjson_available = True
+else:
+    try:
+        import orjson
+    except ImportError:
+        _orjson_available = False
+    else:
+        _orjson_available = True
+
 __all__ = (
     'AgentDepsT',
     'DocstringFormat',
@@ -60,12 +72,15 @@ class RunContext(Generic[AgentDepsT]):
         self, retry: int | None = None, tool_name: str | None | _utils.Unset = _utils.UNSET
     ) -> RunContext[AgentDepsT]:
         # Create a new `RunContext` a new `retry` value and `tool_name`.
-        kwargs = {}
+        # This runs once per tool call, so build the copy directly rather than via `dataclasses.replace`,
+        # which re-runs field introspection and `__init__` on every call.
+        new = object.__new__(type(self))
+        new.__dict__ = dict(self.__dict__)
         if retry is not None:
-            kwargs['retry'] = retry
-        if tool_name is not _utils.UNSET:
-            kwargs['tool_name'] = tool_name
-        return dataclasses.replace(self, **kwargs)
+            new.retry = retry
+        if not isinstance(tool_name, _utils.Unset):
+            new.tool_name = tool_name
+        return new
 
 
 ToolParams = ParamSpec('ToolParams', default=...)
@@ -139,6 +154,14 @@ DocstringFormat = Literal['google', 'numpy', 'sphinx', 'auto']
 
 A = TypeVar('A')
 
+_use_orjson = os.getenv('PYDANTIC_AI_USE_ORJSON', '').lower() in ('1', 'true')
+"""Experimental: parse JSON tool arguments with [orjson](https://github.com/ijl/orjson).
+
+Enabled by setting the `PYDANTIC_AI_USE_ORJSON` environment variable to `1` or `true`.
+Requires `orjson` to be installed, it is not a dependency of pydantic-ai; if it's missing the flag is
+ignored. pydantic-core's own JSON parser is already fast; only enable this if you've benchmarked it
+as a win for your workload."""
+
 
 @dataclass(init=False)
 class Tool(Generic[AgentDepsT]):
@@ -152,11 +175,19 @@ class Tool(Generic[AgentDepsT]):
     prepare: ToolPrepareFunc[AgentDepsT] | None
     docstring_format: DocstringFormat
     require_parameter_descriptions: bool
+    inline_sync: bool
     _is_async: bool = field(init=False)
     _single_arg_name: str | None = field(init=False)
-    _positional_fields: list[str] = field(init=False)
+    _positional_fields: tuple[str, ...] = field(init=False)
     _var_positional_field: str | None = field(init=False)
     _validator: SchemaValidator = field(init=False, repr=False)
+    # bound methods of `_validator`, cached to avoid attribute lookups on the hot path in `run`
+    _validate_json: Callable[[str], Any] = field(init=False, repr=False)
+    _validate_python: Callable[[Any], Any] = field(init=False, repr=False)
+    # specialised argument-marshalling function built once per tool, see `_build_call_args_impl`
+    _call_args_impl: Callable[[RunContext[AgentDepsT], dict[str, Any]], tuple[list[Any], dict[str, Any]]] = field(
+        init=False, repr=False
+    )
     _parameters_json_schema: ObjectJsonSchema = field(init=False)
 
     # TODO: Move this state off the Tool class, which is otherwise stateless.
@@ -174,6 +205,7 @@ class Tool(Generic[AgentDepsT]):
         prepare: ToolPrepareFunc[AgentDepsT] | None = None,
         docstring_format: DocstringFormat = 'auto',
         require_parameter_descriptions: bool = False,
+        inline_sync: bool = False,
     ):
         """Create a new tool instance.
 
@@ -223,6 +255,10 @@ class Tool(Generic[AgentDepsT]):
             docstring_format: The format of the docstring, see [`DocstringFormat`][pydantic_ai.tools.DocstringFormat].
                 Defaults to `'auto'`, such that the format is inferred from the structure of the docstring.
             require_parameter_descriptions: If True, raise an error if a parameter description is missing. Defaults to False.
+            inline_sync: If True, run a synchronous function directly on the event loop instead of via a
+                thread pool executor. This avoids the thread hop (tens of microseconds per call) but blocks
+                the event loop while the function runs, so only use it for functions that return almost
+                instantly, e.g. simple formatting or lookups. Has no effect on async functions.
         """
         if takes_ctx is None:
             takes_ctx = _pydantic.takes_ctx(function)
@@ -236,11 +272,15 @@ class Tool(Generic[AgentDepsT]):
         self.prepare = prepare
         self.docstring_format = docstring_format
         self.require_parameter_descriptions = require_parameter_descriptions
+        self.inline_sync = inline_sync
         self._is_async = inspect.iscoroutinefunction(self.function)
         self._single_arg_name = f['single_arg_name']
-        self._positional_fields = f['positional_fields']
+        self._positional_fields = tuple(f['positional_fields'])
         self._var_positional_field = f['var_positional_field']
         self._validator = f['validator']
+        self._validate_json = self._validator.validate_json
+        self._validate_python = self._validator.validate_python
+        self._call_args_impl = self._build_call_args_impl()
         self._parameters_json_schema = f['json_schema']
 
     async def prepare_tool_def(self, ctx: RunContext[AgentDepsT]) -> ToolDefinition | None:
@@ -268,9 +308,18 @@ class Tool(Generic[AgentDepsT]):
         """Run the tool function asynchronously."""
         try:
             if isinstance(message.args, str):
-                args_dict = self._validator.validate_json(message.args)
+                if _use_orjson and _orjson_available:
+                    try:
+                        parsed_args = orjson.loads(message.args)
+                    except orjson.JSONDecodeError:
+                        # let pydantic-core parse the malformed JSON so the retry prompt gets its error details
+                        args_dict = self._validate_json(message.args)
+                    else:
+                        args_dict = self._validate_python(parsed_args)
+                else:
+                    args_dict = self._validate_json(message.args)
             else:
-                args_dict = self._validator.validate_python(message.args)
+                args_dict = self._validate_python(message.args)
         except ValidationError as e:
             return self._on_error(e, message)
 
@@ -279,6 +328,9 @@ class Tool(Generic[AgentDepsT]):
             if self._is_async:
                 function = cast(Callable[[Any], Awaitable[str]], self.function)
                 response_content = await function(*args, **kwargs)
+            elif self.inline_sync:
+                function = cast(Callable[[Any], str], self.function)
+                response_content = function(*args, **kwargs)
             else:
                 function = cast(Callable[[Any], str], self.function)
                 response_content = await _utils.run_in_executor(function, *args, **kwargs)
@@ -298,17 +350,49 @@ class Tool(Generic[AgentDepsT]):
         message: _messages.ToolCallPart,
         run_context: RunContext[AgentDepsT],
     ) -> tuple[list[Any], dict[str, Any]]:
-        if self._single_arg_name:
-            args_dict = {self._single_arg_name: args_dict}
+        ctx = run_context.replace_with(retry=self.current_retry, tool_name=message.tool_name)
+        return self._call_args_impl(ctx, args_dict)
+
+    def _build_call_args_impl(
+        self,
+    ) -> Callable[[RunContext[AgentDepsT], dict[str, Any]], tuple[list[Any], dict[str, Any]]]:
+        """Build the argument-marshalling function used by `_call_args`.
+
+        The function signature is fixed at construction time, so the common case — all arguments passed
+        as keywords — gets a specialised implementation with no per-call branching or field loop, and the
+        generic implementation reads the field names from closure cells rather than attributes.
+        """
+        single_arg_name = self._single_arg_name
+        positional_fields = self._positional_fields
+        var_positional_field = self._var_positional_field
+        takes_ctx = self.takes_ctx
+
+        if single_arg_name is None and not positional_fields and var_positional_field is None:
+            if takes_ctx:
+
+                def impl(ctx: RunContext[AgentDepsT], args_dict: dict[str, Any]) -> tuple[list[Any], dict[str, Any]]:
+                    return [ctx], args_dict
+
+            else:
+
+                def impl(ctx: RunContext[AgentDepsT], args_dict: dict[str, Any]) -> tuple[list[Any], dict[str, Any]]:
+                    return [], args_dict
+
+        else:
+
+            def impl(ctx: RunContext[AgentDepsT], args_dict: dict[str, Any]) -> tuple[list[Any], dict[str, Any]]:
+                if single_arg_name:
+                    args_dict = {single_arg_name: args_dict}
+
+                args = [ctx] if takes_ctx else []
+                for positional_field in positional_fields:
+                    args.append(args_dict.pop(positional_field))
+                if var_positional_field:
+                    args.extend(args_dict.pop(var_positional_field))
 
-        ctx = dataclasses.replace(run_context, retry=self.current_retry, tool_name=message.tool_name)
-        args = [ctx] if self.takes_ctx else []
-        for positional_field in self._positional_fields:
-            args.append(args_dict.pop(positional_field))
-        if self._var_positional_field:
-            args.extend(args_dict.pop(self._var_positional_field))
+                return args, args_dict
 
-        return args, args_dict
+        return impl
 
     def _on_error(
         self, exc: ValidationError | ModelRetry, call_message: _messages.ToolCallPart
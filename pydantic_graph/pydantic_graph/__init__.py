@@ -1,5 +1,6 @@
 from .exceptions import GraphRuntimeError, GraphSetupError
 from .graph import Graph
+from .history import HistoryStore, RingBufferHistory, StreamingHistory
 from .nodes import BaseNode, Edge, End, GraphRunContext
 from .state import EndStep, HistoryStep, NodeStep
 
@@ -12,6 +13,9 @@ __all__ = (
     'EndStep',
     'HistoryStep',
     'NodeStep',
+    'HistoryStore',
+    'RingBufferHistory',
+    'StreamingHistory',
     'GraphSetupError',
     'GraphRuntimeError',
 )
@@ -9,13 +9,14 @@ from dataclasses import dataclass, field
 from functools import cached_property
 from pathlib import Path
 from time import perf_counter
-from typing import TYPE_CHECKING, Annotated, Any, Callable, Generic, TypeVar
+from typing import TYPE_CHECKING, Annotated, Any, Callable, Generic, TypeVar, cast
 
 import logfire_api
 import pydantic
 import typing_extensions
 
 from . import _utils, exceptions, mermaid
+from .history import HistoryStore
 from .nodes import BaseNode, DepsT, End, GraphRunContext, NodeDef, RunEndT
 from .state import EndStep, HistoryStep, NodeStep, StateT, deep_copy_state, nodes_schema_var
 
@@ -88,6 +89,7 @@ class Graph(Generic[StateT, DepsT, RunEndT]):
     _state_type: type[StateT] | _utils.Unset = field(repr=False)
     _run_end_type: type[RunEndT] | _utils.Unset = field(repr=False)
     _auto_instrument: bool = field(repr=False)
+    _node_class_ids: dict[type[BaseNode[StateT, DepsT, RunEndT]], str] = field(repr=False)
 
     def __init__(
         self,
@@ -110,7 +112,9 @@ class Graph(Generic[StateT, DepsT, RunEndT]):
             run_end_type: The type of the result of running the graph, this can generally be inferred from `nodes`.
             snapshot_state: A function to snapshot the state of the graph, this is used in
                 [`NodeStep`][pydantic_graph.state.NodeStep] and [`EndStep`][pydantic_graph.state.EndStep] to record
-                the state before each step.
+                the state before each step. Defaults to [`deep_copy_state`][pydantic_graph.state.deep_copy_state];
+                pass [`no_copy_state`][pydantic_graph.state.no_copy_state] to avoid the copy entirely when you
+                don't need to inspect intermediate states in history.
             auto_instrument: Whether to create a span for the graph run and the execution of each node's run method.
         """
         self.name = name
@@ -119,12 +123,24 @@ class Graph(Generic[StateT, DepsT, RunEndT]):
         self._auto_instrument = auto_instrument
         self.snapshot_state = snapshot_state
 
-        parent_namespace = _utils.get_parent_namespace(inspect.currentframe())
+        # materializing the parent frame's namespace (`frame.f_locals`) builds a fresh dict on each
+        # construction, so only do it if a node's return annotation actually fails to resolve without it;
+        # GraphSetupError is retried too since a module-scope name shadowing the caller's local can
+        # resolve an annotation to something that isn't a node
+        frame = inspect.currentframe()
+        parent_namespace: dict[str, Any] | None | _utils.Unset = _utils.UNSET
         self.node_defs: dict[str, NodeDef[StateT, DepsT, RunEndT]] = {}
         for node in nodes:
-            self._register_node(node, parent_namespace)
+            try:
+                self._register_node(node, None)
+            except (NameError, exceptions.GraphSetupError):
+                if isinstance(parent_namespace, _utils.Unset):
+                    parent_namespace = _utils.get_parent_namespace(frame)
+                self._register_node(node, parent_namespace)
 
         self._validate_edges()
+        # type -> id dispatch table so `next` can resolve a node's id with one dict lookup
+        self._node_class_ids = {node_def.node: node_id for node_id, node_def in self.node_defs.items()}
 
     async def run(
         self: Graph[StateT, DepsT, T],
@@ -133,6 +149,7 @@ class Graph(Generic[StateT, DepsT, RunEndT]):
         state: StateT = None,
         deps: DepsT = None,
         infer_name: bool = True,
+        history_store: HistoryStore[StateT, T] | None = None,
     ) -> tuple[T, list[HistoryStep[StateT, T]]]:
         """Run the graph from a starting node until it ends.
 
@@ -142,6 +159,10 @@ class Graph(Generic[StateT, DepsT, RunEndT]):
             state: The initial state of the graph.
             deps: The dependencies of the graph.
             infer_name: Whether to infer the graph name from the calling frame.
+            history_store: Optional [`HistoryStore`][pydantic_graph.history.HistoryStore] to collect history
+                steps instead of an unbounded list, e.g.
+                [`RingBufferHistory`][pydantic_graph.history.RingBufferHistory] to bound memory on
+                long runs. The returned history contains whatever steps the store retained.
 
         Returns:
             The result type from ending the run and the history of the run.
@@ -170,7 +191,8 @@ class Graph(Generic[StateT, DepsT, RunEndT]):
         if infer_name and self.name is None:
             self._infer_name(inspect.currentframe())
 
-        history: list[HistoryStep[StateT, T]] = []
+        history: list[HistoryStep[StateT, T]] | HistoryStore[StateT, T]
+        history = [] if history_store is None else history_store
         with ExitStack() as stack:
             run_span: logfire_api.LogfireSpan | None = None
             if self._auto_instrument:
@@ -185,13 +207,23 @@ class Graph(Generic[StateT, DepsT, RunEndT]):
             next_node = start_node
             while True:
                 next_node = await self.next(next_node, history, state=state, deps=deps, infer_name=False)
-                if isinstance(next_node, End):
-                    history.append(EndStep(result=next_node))
+                # dispatch on the `_kind` class discriminator rather than `isinstance` — checks against
+                # the `BaseNode` ABC and generic `End` are measurably slow on this per-step loop
+                kind = getattr(type(next_node), '_kind', None)
+                if kind == 'end':
+                    end = cast(End[T], next_node)
+                    history.append(EndStep(result=end))
+                    history_list = history if isinstance(history, list) else list(history)
                     if run_span is not None:
-                        run_span.set_attribute('history', history)
-                    return next_node.data, history
-                elif not isinstance(next_node, BaseNode):
+                        run_span.set_attribute('history', history_list)
+                    return end.data, history_list
+                elif kind == 'node':
+                    next_node = cast(BaseNode[StateT, DepsT, Any], next_node)
+                else:
                     if TYPE_CHECKING:
+                        # static equivalent of the dispatch above — keeps exhaustiveness checked if
+                        # `next`'s return type ever grows beyond `BaseNode | End`
+                        assert not isinstance(next_node, (BaseNode, End))
                         typing_extensions.assert_never(next_node)
                     else:
                         raise exceptions.GraphRuntimeError(
@@ -205,6 +237,7 @@ class Graph(Generic[StateT, DepsT, RunEndT]):
         state: StateT = None,
         deps: DepsT = None,
         infer_name: bool = True,
+        history_store: HistoryStore[StateT, T] | None = None,
     ) -> tuple[T, list[HistoryStep[StateT, T]]]:
         """Run the graph synchronously.
 
@@ -217,6 +250,8 @@ class Graph(Generic[StateT, DepsT, RunEndT]):
             state: The initial state of the graph.
             deps: The dependencies of the graph.
             infer_name: Whether to infer the graph name from the calling frame.
+            history_store: Optional [`HistoryStore`][pydantic_graph.history.HistoryStore] to collect history
+                steps, see [`run`][pydantic_graph.graph.Graph.run].
 
         Returns:
             The result type from ending the run and the history of the run.
@@ -224,13 +259,13 @@ class Graph(Generic[StateT, DepsT, RunEndT]):
         if infer_name and self.name is None:
             self._infer_name(inspect.currentframe())
         return asyncio.get_event_loop().run_until_complete(
-            self.run(start_node, state=state, deps=deps, infer_name=False)
+            self.run(start_node, state=state, deps=deps, infer_name=False, history_store=history_store)
         )
 
     async def next(
         self: Graph[StateT, DepsT, T],
         node: BaseNode[StateT, DepsT, T],
-        history: list[HistoryStep[StateT, T]],
+        history: list[HistoryStep[StateT, T]] | HistoryStore[StateT, T],
         *,
         state: StateT = None,
         deps: DepsT = None,
@@ -250,21 +285,27 @@ class Graph(Generic[StateT, DepsT, RunEndT]):
         """
         if infer_name and self.name is None:
             self._infer_name(inspect.currentframe())
-        node_id = node.get_id()
-        if node_id not in self.node_defs:
-            raise exceptions.GraphRuntimeError(f'Node `{node}` is not in the graph.')
-
-        with ExitStack() as stack:
-            if self._auto_instrument:
-                stack.enter_context(_logfire.span('run node {node_id}', node_id=node_id, node=node))
-            ctx = GraphRunContext(state, deps)
-            start_ts = _utils.now_utc()
+        node_id = self._node_class_ids.get(type(node))
+        if node_id is None:
+            # dispatch miss — e.g. a different class object reusing a registered node id
+            node_id = node.get_id()
+            if node_id not in self.node_defs:
+                raise exceptions.GraphRuntimeError(f'Node `{node}` is not in the graph.')
+
+        ctx = GraphRunContext(state, deps)
+        start_ts = _utils.now_utc()
+        if self._auto_instrument:
+            with _logfire.span('run node {node_id}', node_id=node_id, node=node):
+                start = perf_counter()
+                next_node = await node.run(ctx)
+                duration = perf_counter() - start
+        else:
             start = perf_counter()
             next_node = await node.run(ctx)
             duration = perf_counter() - start
 
         history.append(
-            NodeStep(state=state, node=node, start_ts=start_ts, duration=duration, snapshot_state=self.snapshot_state)
+            NodeStep._fast_new(self.snapshot_state(state), node, start_ts, duration, self.snapshot_state)  # pyright: ignore[reportPrivateUsage]
         )
         return next_node
 
@@ -477,9 +518,13 @@ class Graph(Generic[StateT, DepsT, RunEndT]):
         bad_edges: dict[str, list[str]] = {}
 
         for node_id, node_def in self.node_defs.items():
-            for edge in node_def.next_node_edges.keys():
-                if edge not in known_node_ids:
-                    bad_edges.setdefault(edge, []).append(f'`{node_id}`')
+            # bulk set difference is a single C-level operation, vs a membership check per edge
+            missing = node_def.next_node_edges.keys() - known_node_ids
+            if missing:
+                # report bad edges in annotation order for a deterministic error message
+                for edge, _ in node_def.next_node_edge_items:
+                    if edge in missing:
+                        bad_edges.setdefault(edge, []).append(f'`{node_id}`')
 
         if bad_edges:
             bad_edges_list = [f'`{k}` is referenced by {_utils.comma_and(v)}' for k, v in bad_edges.items()]
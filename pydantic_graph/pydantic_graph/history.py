@@ -0,0 +1,77 @@
+from __future__ import annotations as _annotations
+
+from collections import deque
+from collections.abc import Iterator
+from typing import Callable, Generic
+
+from typing_extensions import Protocol, TypeVar, runtime_checkable
+
+from .state import HistoryStep
+
+__all__ = 'HistoryStore', 'RingBufferHistory', 'StreamingHistory'
+
+# invariant type variables, declared here rather than reused from `nodes` — steps are both consumed
+# (`append`) and produced (`__iter__`) by a store, so the covariant `RunEndT` would be unsound
+StateT = TypeVar('StateT', default=None)
+RunEndT = TypeVar('RunEndT', default=None)
+
+
+@runtime_checkable
+class HistoryStore(Protocol[StateT, RunEndT]):
+    """Protocol for objects that collect history steps during a graph run.
+
+    A plain `list` satisfies this protocol and is what [`Graph.run`][pydantic_graph.graph.Graph.run] uses
+    by default. Alternative stores let long-running graphs bound the memory held by history — appending to
+    a list retains every step (and its state snapshot) until the run ends.
+    """
+
+    def append(self, step: HistoryStep[StateT, RunEndT]) -> None:
+        """Record a step of the run."""
+        ...
+
+    def __iter__(self) -> Iterator[HistoryStep[StateT, RunEndT]]:
+        """Iterate over the retained steps, oldest first."""
+        ...
+
+
+class RingBufferHistory(Generic[StateT, RunEndT]):
+    """History store that retains only the most recent `maxlen` steps.
+
+    Older steps (and their state snapshots) are dropped as new ones arrive, so memory use is bounded
+    regardless of how many steps the run takes.
+    """
+
+    def __init__(self, maxlen: int):
+        self._steps: deque[HistoryStep[StateT, RunEndT]] = deque(maxlen=maxlen)
+
+    def append(self, step: HistoryStep[StateT, RunEndT]) -> None:
+        self._steps.append(step)
+
+    def __iter__(self) -> Iterator[HistoryStep[StateT, RunEndT]]:
+        return iter(self._steps)
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __repr__(self) -> str:
+        return f'RingBufferHistory(maxlen={self._steps.maxlen}, len={len(self._steps)})'
+
+
+class StreamingHistory(Generic[StateT, RunEndT]):
+    """History store that forwards each step to a callback without retaining it.
+
+    Useful for flushing history to disk or a log as the run progresses; iterating the store always
+    yields nothing.
+    """
+
+    def __init__(self, callback: Callable[[HistoryStep[StateT, RunEndT]], None]):
+        self._callback = callback
+
+    def append(self, step: HistoryStep[StateT, RunEndT]) -> None:
+        self._callback(step)
+
+    def __iter__(self) -> Iterator[HistoryStep[StateT, RunEndT]]:
+        return iter(())
+
+    def __repr__(self) -> str:
+        return f'StreamingHistory(callback={self._callback!r})'
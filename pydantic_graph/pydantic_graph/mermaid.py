@@ -28,6 +28,8 @@ __all__ = (
 DEFAULT_HIGHLIGHT_CSS = 'fill:#fdff32'
 """The default CSS to use for highlighting nodes."""
 
+_MULTIPLE_BLANK_LINES_RE = re.compile('\n{2,}')
+
 StateDiagramDirection = Literal['TB', 'LR', 'RL', 'BT']
 """Used to specify the direction of the state diagram generated by mermaid.
 
@@ -82,14 +84,15 @@ def generate_code(  # noqa: C901
         if node_id in start_node_ids:
             lines.append(f'  [*] --> {node_id}')
         if node_def.returns_base_node:
-            for next_node_id in graph.node_defs:
-                lines.append(f'  {node_id} --> {next_node_id}')
+            lines.extend(f'  {node_id} --> {next_node_id}' for next_node_id in graph.node_defs)
+        elif edge_labels:
+            for next_node_id, edge in node_def.next_node_edge_items:
+                if edge.label:
+                    lines.append(f'  {node_id} --> {next_node_id}: {edge.label}')
+                else:
+                    lines.append(f'  {node_id} --> {next_node_id}')
         else:
-            for next_node_id, edge in node_def.next_node_edges.items():
-                line = f'  {node_id} --> {next_node_id}'
-                if edge_labels and edge.label:
-                    line += f': {edge.label}'
-                lines.append(line)
+            lines.extend(f'  {node_id} --> {next_node_id}' for next_node_id, _ in node_def.next_node_edge_items)
         if end_edge := node_def.end_edge:
             line = f'  {node_id} --> [*]'
             if edge_labels and end_edge.label:
@@ -99,7 +102,7 @@ def generate_code(  # noqa: C901
         if notes and node_def.note:
             lines.append(f'  note right of {node_id}')
             # mermaid doesn't like multiple paragraphs in a note, and shows if so
-            clean_docs = re.sub('\n{2,}', '\n', node_def.note)
+            clean_docs = _MULTIPLE_BLANK_LINES_RE.sub('\n', node_def.note)
             lines.append(indent(clean_docs, '    '))
             lines.append('  end note')
 
@@ -154,45 +157,68 @@ def request_image(
         notes=kwargs.get('notes', True),
         direction=kwargs.get('direction'),
     )
-    code_base64 = base64.b64encode(code.encode()).decode()
+    # the encoded code can be tens of KB for a large graph, encode it exactly once
+    code_base64 = base64.b64encode(code.encode('utf-8')).decode('ascii')
+    url, params = _build_image_request(code_base64, kwargs)
 
+    httpx_client = kwargs.get('httpx_client') or _get_default_client()
+    response = httpx_client.get(url, params=params)
+    if not response.is_success:
+        raise httpx.HTTPStatusError(
+            f'{response.status_code} error generating image:\n{response.text}',
+            request=response.request,
+            response=response,
+        )
+    return response.content
+
+
+def _build_image_request(code_base64: str, config: MermaidConfig) -> tuple[str, dict[str, str | float]]:
+    """Build the mermaid.ink URL and query params for an image request."""
     params: dict[str, str | float] = {}
-    if kwargs.get('image_type') == 'pdf':
+    image_type = config.get('image_type')
+    if image_type == 'pdf':
         url = f'https://mermaid.ink/pdf/{code_base64}'
-        if kwargs.get('pdf_fit'):
+        if config.get('pdf_fit'):
             params['fit'] = ''
-        if kwargs.get('pdf_landscape'):
+        if config.get('pdf_landscape'):
             params['landscape'] = ''
-        if pdf_paper := kwargs.get('pdf_paper'):
+        if pdf_paper := config.get('pdf_paper'):
             params['paper'] = pdf_paper
-    elif kwargs.get('image_type') == 'svg':
+    elif image_type == 'svg':
         url = f'https://mermaid.ink/svg/{code_base64}'
     else:
         url = f'https://mermaid.ink/img/{code_base64}'
 
-        if image_type := kwargs.get('image_type'):
+        if image_type:
             params['type'] = image_type
 
-    if background_color := kwargs.get('background_color'):
+    if background_color := config.get('background_color'):
         params['bgColor'] = background_color
-    if theme := kwargs.get('theme'):
+    if theme := config.get('theme'):
         params['theme'] = theme
-    if width := kwargs.get('width'):
+    if width := config.get('width'):
         params['width'] = width
-    if height := kwargs.get('height'):
+    if height := config.get('height'):
         params['height'] = height
-    if scale := kwargs.get('scale'):
+    if scale := config.get('scale'):
         params['scale'] = scale
 
-    httpx_client = kwargs.get('httpx_client') or httpx.Client()
-    response = httpx_client.get(url, params=params)
-    if not response.is_success:
-        raise httpx.HTTPStatusError(
-            f'{response.status_code} error generating image:\n{response.text}',
-            request=response.request,
-            response=response,
-        )
-    return response.content
+    return url, params
+
+
+_default_client: httpx.Client | None = None
+
+
+def _get_default_client() -> httpx.Client:
+    """Get the shared client used when no `httpx_client` is passed.
+
+    Reusing one client keeps connections to mermaid.ink alive, so repeated image requests
+    (e.g. rendering diagrams for many graphs) skip the TCP and TLS handshake after the first.
+    """
+    global _default_client
+    if _default_client is None:
+        _default_client = httpx.Client(timeout=30, limits=httpx.Limits(max_keepalive_connections=8))
+    return _default_client
 
 
 def save_image(
@@ -1,7 +1,8 @@
 from __future__ import annotations as _annotations
 
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, is_dataclass
+from dataclasses import dataclass, field, is_dataclass
 from functools import cache
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, get_origin, get_type_hints
 
@@ -37,6 +38,10 @@ class GraphRunContext(Generic[StateT, DepsT]):
 class BaseNode(ABC, Generic[StateT, DepsT, NodeRunEndT]):
     """Base class for a node."""
 
+    _kind: ClassVar[str] = 'node'
+    """Discriminator used by [`Graph.run`][pydantic_graph.graph.Graph.run] to identify node return values
+    without `isinstance` checks against this ABC, which are slow on the per-step hot path."""
+
     docstring_notes: ClassVar[bool] = False
     """Set to `True` to generate mermaid diagram notes from the class's docstring.
 
@@ -68,7 +73,9 @@ class BaseNode(ABC, Generic[StateT, DepsT, NodeRunEndT]):
     @cache
     def get_id(cls) -> str:
         """Get the ID of the node."""
-        return cls.__name__
+        # interning lets dict lookups keyed by node id (e.g. in `Graph.next`) hit CPython's
+        # pointer-equality fast path instead of comparing the strings char by char
+        return sys.intern(cls.__name__)
 
     @classmethod
     def get_note(cls) -> str | None:
@@ -90,9 +97,32 @@ class BaseNode(ABC, Generic[StateT, DepsT, NodeRunEndT]):
             docstring = inspect.cleandoc(docstring)
         return docstring
 
+    _node_def_cache: ClassVar[dict[int, tuple[dict[str, Any] | None, NodeDef[Any, Any, Any]]]]
+
     @classmethod
     def get_node_def(cls, local_ns: dict[str, Any] | None) -> NodeDef[StateT, DepsT, NodeRunEndT]:
-        """Get the node definition."""
+        """Get the node definition.
+
+        Since the return annotation of `run` is static, the definition is built once per `(class, namespace)`
+        pair — this avoids repeating the expensive `get_type_hints` call when the same node is registered
+        on several graphs.
+        """
+        cache: dict[int, tuple[dict[str, Any] | None, NodeDef[Any, Any, Any]]] | None = cls.__dict__.get(
+            '_node_def_cache'
+        )
+        if cache is None:
+            cache = {}
+            cls._node_def_cache = cache
+        key = id(local_ns)
+        if entry := cache.get(key):
+            return entry[1]
+        node_def = cls._build_node_def(local_ns)
+        # keep a reference to `local_ns` so its id can't be recycled while the entry is cached
+        cache[key] = local_ns, node_def
+        return node_def
+
+    @classmethod
+    def _build_node_def(cls, local_ns: dict[str, Any] | None) -> NodeDef[StateT, DepsT, NodeRunEndT]:
         type_hints = get_type_hints(cls.run, localns=local_ns, include_extras=True)
         try:
             return_hint = type_hints['return']
@@ -130,6 +160,8 @@ class BaseNode(ABC, Generic[StateT, DepsT, NodeRunEndT]):
 class End(Generic[RunEndT]):
     """Type to return from a node to signal the end of the graph."""
 
+    _kind: ClassVar[str] = 'end'
+
     data: RunEndT
     """Data to return from the graph."""
 
@@ -164,3 +196,8 @@ class NodeDef(Generic[StateT, DepsT, NodeRunEndT]):
     """If node definition returns an `End` this is an Edge, indicating the node can end the run."""
     returns_base_node: bool
     """The node definition returns a `BaseNode`, hence any node in the next can be called next."""
+    next_node_edge_items: tuple[tuple[str, Edge], ...] = field(init=False, repr=False)
+    """`next_node_edges` as a tuple of items, precomputed so hot loops avoid allocating dict views."""
+
+    def __post_init__(self):
+        self.next_node_edge_items = tuple(self.next_node_edges.items())
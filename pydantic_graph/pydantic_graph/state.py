@@ -5,7 +5,7 @@ from collections.abc import Sequence
 from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Annotated, Any, Callable, Generic, Literal, Union
+from typing import Annotated, Any, Callable, Generic, Literal, Union, cast
 
 import pydantic
 from pydantic_core import core_schema
@@ -14,12 +14,17 @@ from typing_extensions import TypeVar
 from . import _utils
 from .nodes import BaseNode, End, RunEndT
 
-__all__ = 'StateT', 'NodeStep', 'EndStep', 'HistoryStep', 'deep_copy_state', 'nodes_schema_var'
+__all__ = 'StateT', 'NodeStep', 'EndStep', 'HistoryStep', 'deep_copy_state', 'no_copy_state', 'nodes_schema_var'
 
 
 StateT = TypeVar('StateT', default=None)
 """Type variable for the state in a graph."""
 
+# fresh type variables for `NodeStep._fast_new` — binding to the classmethod's owner would pin
+# `StateT`/`RunEndT` to their defaults at the call site
+_StateT = TypeVar('_StateT')
+_RunEndT = TypeVar('_RunEndT')
+
 
 def deep_copy_state(state: StateT) -> StateT:
     """Default method for snapshotting the state in a graph run, uses [`copy.deepcopy`][copy.deepcopy]."""
@@ -29,6 +34,17 @@ def deep_copy_state(state: StateT) -> StateT:
         return copy.deepcopy(state)
 
 
+def no_copy_state(state: StateT) -> StateT:
+    """Snapshot method that stores the state without copying it.
+
+    `copy.deepcopy` is O(size of state) per step, which can dominate runs with large state objects.
+    Pass this as `snapshot_state` to [`Graph`][pydantic_graph.graph.Graph] to skip copying when you
+    don't inspect intermediate states in history — history steps will then all reference the same,
+    final, state object.
+    """
+    return state
+
+
 @dataclass
 class NodeStep(Generic[StateT, RunEndT]):
     """History step describing the execution of a node in a graph."""
@@ -53,6 +69,30 @@ class NodeStep(Generic[StateT, RunEndT]):
         # Copy the state to prevent it from being modified by other code
         self.state = self.snapshot_state(self.state)
 
+    @classmethod
+    def _fast_new(
+        cls,
+        state: _StateT,
+        node: BaseNode[_StateT, Any, _RunEndT],
+        start_ts: datetime,
+        duration: float,
+        snapshot_state: Callable[[_StateT], _StateT],
+    ) -> NodeStep[_StateT, _RunEndT]:
+        """Construct a step without running `__init__` or `__post_init__`.
+
+        `state` must already be a snapshot — it is stored as-is. Used by
+        [`Graph.next`][pydantic_graph.graph.Graph.next] to skip dataclass constructor overhead on the
+        per-step hot path.
+        """
+        self = cast('NodeStep[_StateT, _RunEndT]', object.__new__(cls))
+        self.state = state
+        self.node = node
+        self.start_ts = start_ts
+        self.duration = duration
+        self.kind = 'node'
+        self.snapshot_state = snapshot_state
+        return self
+
     def data_snapshot(self) -> BaseNode[StateT, Any, RunEndT]:
         """Returns a deep copy of [`self.node`][pydantic_graph.state.NodeStep.node].
 
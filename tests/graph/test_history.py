@@ -9,7 +9,18 @@ import pytest
 from dirty_equals import IsStr
 from inline_snapshot import snapshot
 
-from pydantic_graph import BaseNode, End, EndStep, Graph, GraphRunContext, GraphSetupError, NodeStep
+from pydantic_graph import (
+    BaseNode,
+    End,
+    EndStep,
+    Graph,
+    GraphRunContext,
+    GraphSetupError,
+    HistoryStep,
+    NodeStep,
+    RingBufferHistory,
+    StreamingHistory,
+)
 
 from ..conftest import IsFloat, IsNow
 
@@ -144,3 +155,31 @@ def test_no_generic_arg():
             EndStep(result=End(data=None), ts=datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)),
         ]
     )
+
+
+async def test_run_ring_buffer_history():
+    graph = Graph(nodes=(Foo, Bar))
+    store: RingBufferHistory[MyState, int] = RingBufferHistory(maxlen=2)
+    result, history = await graph.run(Foo(), state=MyState(1, ''), history_store=store)
+    assert result == snapshot(4)
+    # only the most recent two steps are retained
+    assert history == snapshot(
+        [
+            NodeStep(state=MyState(x=2, y='y'), node=Bar(), start_ts=IsNow(tz=timezone.utc), duration=IsFloat()),
+            EndStep(result=End(4), ts=IsNow(tz=timezone.utc)),
+        ]
+    )
+    assert len(store) == 2
+    assert repr(store) == snapshot('RingBufferHistory(maxlen=2, len=2)')
+
+
+async def test_run_streaming_history():
+    graph = Graph(nodes=(Foo, Bar))
+    seen: list[HistoryStep[MyState, int]] = []
+    store = StreamingHistory(seen.append)
+    result, history = await graph.run(Foo(), state=MyState(1, ''), history_store=store)
+    assert result == snapshot(4)
+    # the store retains nothing itself, steps are forwarded to the callback
+    assert history == snapshot([])
+    assert [type(step).__name__ for step in seen] == snapshot(['NodeStep', 'NodeStep', 'EndStep'])
+    assert repr(store) == IsStr(regex=r'StreamingHistory\(callback=.+\)')
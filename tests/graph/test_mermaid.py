@@ -11,7 +11,7 @@ import httpx
 import pytest
 from inline_snapshot import snapshot
 
-from pydantic_graph import BaseNode, Edge, End, EndStep, Graph, GraphRunContext, GraphSetupError, NodeStep
+from pydantic_graph import BaseNode, Edge, End, EndStep, Graph, GraphRunContext, GraphSetupError, NodeStep, mermaid
 from pydantic_graph.nodes import NodeDef
 
 from ..conftest import IsFloat, IsNow
@@ -264,6 +264,23 @@ def test_image_jpg(httpx_with_handler: HttpxWithHandler):
     assert img == snapshot(b'---\ntitle: graph1\n---\nstateDiagram-v2\n  [*] --> Foo\n  Foo --> Bar\n  Bar --> [*]')
 
 
+def test_image_default_client(monkeypatch: pytest.MonkeyPatch, httpx_with_handler: HttpxWithHandler):
+    def get_jpg(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b'fake jpg')
+
+    monkeypatch.setattr(mermaid, '_default_client', httpx_with_handler(get_jpg))
+    img = graph1.mermaid_image(start_node=Foo())
+    assert img == b'fake jpg'
+
+
+def test_get_default_client(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(mermaid, '_default_client', None)
+    client = mermaid._get_default_client()  # pyright: ignore[reportPrivateUsage]
+    assert isinstance(client, httpx.Client)
+    # memoized, so repeated image requests share one connection pool
+    assert mermaid._get_default_client() is client  # pyright: ignore[reportPrivateUsage]
+
+
 def test_image_png(httpx_with_handler: HttpxWithHandler):
     def get_png(request: httpx.Request) -> httpx.Response:
         assert dict(request.url.params) == snapshot(
@@ -56,3 +56,30 @@ async def test_run_graph():
         ]
     )
     assert state == MyState(x=2, y='y')
+
+
+async def test_run_graph_no_copy_state():
+    from pydantic_graph.state import no_copy_state
+
+    @dataclass
+    class MyState:
+        x: int
+
+    @dataclass
+    class Foo(BaseNode[MyState]):
+        async def run(self, ctx: GraphRunContext[MyState]) -> Bar:
+            ctx.state.x += 1
+            return Bar()
+
+    @dataclass
+    class Bar(BaseNode[MyState, None, int]):
+        async def run(self, ctx: GraphRunContext[MyState]) -> End[int]:
+            ctx.state.x += 1
+            return End(ctx.state.x)
+
+    graph = Graph(nodes=(Foo, Bar), snapshot_state=no_copy_state)
+    state = MyState(0)
+    result, history = await graph.run(Foo(), state=state)
+    assert result == 2
+    # no copies are made, so every step references the same, final, state object
+    assert all(step.state is state for step in history if isinstance(step, NodeStep))
@@ -14,6 +14,7 @@ from pydantic_ai.messages import (
     ModelMessage,
     ModelRequest,
     ModelResponse,
+    RetryPromptPart,
     TextPart,
     ToolCallPart,
     ToolReturnPart,
@@ -684,3 +685,47 @@ def test_call_tool_without_unrequired_parameters(set_event_loop: None):
         ]
     )
     assert tool_returns == snapshot([15, 17, 51, 68])
+
+
+def test_init_tool_inline_sync():
+    def plain_tool(x: int) -> int:
+        return x + 1
+
+    agent = Agent('test', tools=[Tool(plain_tool, inline_sync=True)])
+    result = agent.run_sync('foobar')
+    assert result.data == snapshot('{"plain_tool":1}')
+    assert agent._function_tools['plain_tool'].inline_sync is True
+
+    agent_default = Agent('test', tools=[Tool(plain_tool)])
+    assert agent_default._function_tools['plain_tool'].inline_sync is False
+
+
+def test_tool_args_orjson(monkeypatch: pytest.MonkeyPatch):
+    pytest.importorskip('orjson')
+    monkeypatch.setattr('pydantic_ai.tools._use_orjson', True)
+
+    calls = 0
+
+    async def call_add(_messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            # malformed JSON — should fall back to pydantic-core and produce a retry prompt
+            return ModelResponse(parts=[ToolCallPart('add', '{"x": 1, "y": 2')])
+        elif calls == 2:
+            return ModelResponse(parts=[ToolCallPart('add', '{"x": 1, "y": 2}')])
+        else:
+            return ModelResponse(parts=[TextPart('done')])
+
+    agent = Agent(FunctionModel(call_add))
+
+    @agent.tool_plain
+    def add(x: int, y: int) -> int:
+        return x + y
+
+    result = agent.run_sync('Hello')
+    assert result.data == 'done'
+    retry_parts = [p for m in result.all_messages() if isinstance(m, ModelRequest) for p in m.parts]
+    assert any(isinstance(p, RetryPromptPart) for p in retry_parts)
+    tool_returns = [p.content for p in retry_parts if isinstance(p, ToolReturnPart)]
+    assert tool_returns == snapshot([3])